@@ -1,51 +1,76 @@
 import sys
 import os
-import subprocess
-import threading
+import stat
+import shutil
+import tempfile
 import time
-import ctypes
-import configparser
 import re 
+from collections import deque
+from functools import partial
+from concurrent.futures import ThreadPoolExecutor, as_completed
 
-# Cross-platform theme detection library (install: pip install darkdetect)
-import darkdetect 
 from PySide6.QtWidgets import (
     QApplication, QMainWindow, QWidget, QVBoxLayout, QHBoxLayout,
-    QPushButton, QLabel, QProgressBar, QMessageBox, QFrame,
-    QGraphicsDropShadowEffect
+    QPushButton, QLabel, QProgressBar, QMessageBox, QFrame
 )
 from PySide6.QtCore import (
-    Qt, QThread, Signal, QSettings, QPoint
+    Qt, QThread, Signal, QSettings, QTimer
 )
-from PySide6.QtGui import QDropEvent, QColor, QFont, QIcon
+from PySide6.QtGui import QDropEvent, QColor, QFont, QIcon, QPalette
+
+_IS_WIN = os.name == 'nt'
+
+def _is_age(path):
+    """Case-insensitive .age suffix test that only lowercases the last 4 characters."""
+    return path[-4:].lower() == ".age"
+
+def _is_file(path):
+    """True if path is an existing regular file, using a single stat call."""
+    try:
+        return stat.S_ISREG(os.stat(path).st_mode)
+    except (OSError, ValueError):
+        return False
 
 # ==========================================
 # Windows API (Import and use only on Windows)
 # ==========================================
-if os.name == 'nt':
-    def bring_pid_to_front(pid):
+if _IS_WIN:
+    import ctypes
+
+    _user32 = ctypes.windll.user32
+    _WNDENUMPROC = ctypes.WINFUNCTYPE(ctypes.c_bool, ctypes.c_void_p, ctypes.c_void_p)
+
+    def bring_pid_to_front(pid, timeout=0.5, interval=0.01):
+        """
+        Poll for the first visible window of pid and raise it, giving up after timeout seconds.
+        """
         try:
-            user32 = ctypes.windll.user32
-            WNDENUMPROC = ctypes.WINFUNCTYPE(ctypes.c_bool, ctypes.c_void_p, ctypes.c_void_p)
             target_hwnd = []
             
             def enum_windows_callback(hwnd, _):
                 window_pid = ctypes.c_ulong()
-                user32.GetWindowThreadProcessId(hwnd, ctypes.byref(window_pid))
-                if window_pid.value == pid and user32.IsWindowVisible(hwnd):
+                _user32.GetWindowThreadProcessId(hwnd, ctypes.byref(window_pid))
+                if window_pid.value == pid and _user32.IsWindowVisible(hwnd):
                     target_hwnd.append(hwnd)
                     return False
                 return True
             
-            user32.EnumWindows(WNDENUMPROC(enum_windows_callback), 0)
+            callback = _WNDENUMPROC(enum_windows_callback)
+            deadline = time.monotonic() + timeout
+            while True:
+                _user32.EnumWindows(callback, 0)
+                if target_hwnd or time.monotonic() >= deadline:
+                    break
+                time.sleep(interval)
+
             if target_hwnd:
                 hwnd = target_hwnd[0]
-                user32.ShowWindow(hwnd, 9)
-                user32.SetForegroundWindow(hwnd)
+                _user32.ShowWindow(hwnd, 9)
+                _user32.SetForegroundWindow(hwnd)
         except Exception as e:
             print(f"Fail to bring window to top: {e}")
 else:
-    def bring_pid_to_front(pid):
+    def bring_pid_to_front(pid, timeout=0.5, interval=0.01):
         pass
 
 
@@ -68,14 +93,25 @@ DARK_THEME_COLORS = {
     "SUCCESS_BG": "#232E23",
 }
 
+def get_palette(colors):
+    """Window/text colors go through QPalette; the QSS below only covers what a palette cannot."""
+    palette = QPalette()
+    palette.setColor(QPalette.Window, QColor(colors["BACKGROUND"]))
+    palette.setColor(QPalette.WindowText, QColor(colors["TEXT_PRIMARY"]))
+    palette.setColor(QPalette.Base, QColor(colors["CARD_BG"]))
+    palette.setColor(QPalette.Text, QColor(colors["TEXT_PRIMARY"]))
+    palette.setColor(QPalette.Button, QColor(colors["CARD_BG"]))
+    palette.setColor(QPalette.ButtonText, QColor(colors["TEXT_PRIMARY"]))
+    palette.setColor(QPalette.PlaceholderText, QColor(colors["TEXT_SECONDARY"]))
+    palette.setColor(QPalette.Highlight, QColor(colors["ACCENT"]))
+    return palette
+
 def get_base_stylesheet(colors):
     clear_btn_hover_bg = colors["DANGER_BG"] if colors == LIGHT_THEME_COLORS else "#444444"
     clear_btn_hover_color = colors["DANGER"]
     progress_text_color = "transparent" if colors == LIGHT_THEME_COLORS else colors["TEXT_PRIMARY"]
 
     return f"""
-        QMainWindow {{ background-color: {colors["BACKGROUND"]}; }}
-        QLabel {{ color: {colors["TEXT_PRIMARY"]}; }}
         QPushButton {{
             border-radius: 6px; font-weight: 500; font-size: 13px; padding: 6px 12px;
             background-color: {colors["CARD_BG"]}; border: 1px solid {colors["BORDER"]};
@@ -121,22 +157,111 @@ def get_base_stylesheet(colors):
             border-radius: 5px;
             margin: 0px;
         }}
+
+        /* Message boxes */
+        QMessageBox {{
+            background-color: {colors["CARD_BG"]};
+        }}
+        QMessageBox QPushButton {{
+            border-radius: 6px; font-weight: 500; padding: 6px 12px;
+            background-color: {colors["CARD_BG"]};
+            color: {colors["TEXT_PRIMARY"]};
+            border: 1px solid {colors["BORDER"]};
+        }}
+        QMessageBox QPushButton:hover {{
+            background-color: {colors["BORDER"]};
+        }}
+    """
+
+# Both themes are fixed, so format their sheets once at import.
+LIGHT_QSS = get_base_stylesheet(LIGHT_THEME_COLORS)
+DARK_QSS = get_base_stylesheet(DARK_THEME_COLORS)
+
+def _system_is_dark():
+    """
+    Ask Qt for the system color scheme (Qt 6.5+), which it already tracks.
+    Only fall back to darkdetect, which may query the OS, when Qt cannot tell.
     """
+    color_scheme = getattr(QApplication.styleHints(), "colorScheme", None)
+    if color_scheme is not None:
+        scheme = color_scheme()
+        if scheme != Qt.ColorScheme.Unknown:
+            return scheme == Qt.ColorScheme.Dark
+
+    # Cross-platform theme detection library (install: pip install darkdetect)
+    import darkdetect
+    return bool(darkdetect.isDark())
+
+# ==========================================
+# 📝 UI Strings
+# ==========================================
+STR_TITLE = "YubiAge UI v0.1.1"
+STR_MSGBOX_TITLE = "Message"
+STR_STATUS_ENCRYPT_MODE = "Encrypt Mode"
+STR_STATUS_DECRYPT_MODE = "Decrypt Mode"
+STR_STATUS_ERROR_MIXED = "Terminated."
+STR_STATUS_ERROR_KEY_LOAD = "Key load failed."
+STR_STATUS_ERROR_FILE_KEY_MISSING = "File/Key missing."
+STR_BTN_CLEAR = "Clear State"
+STR_BTN_CLEAR_KEYS = "Clear Keys"
+STR_CONFIRM_CLEAR_KEYS = "Are you sure you want to clear ALL saved public recipient key paths? They must be dropped again for future encryption."
+STR_ERROR_MIXED_FILES = "Do not mix .age file and non-.age file."
+STR_ERROR_INVALID_KEY_PATH = "Invalid key path."
+STR_ERROR_DECRYPT_MULTI = "One file at a time (no folders)"
+STR_MODE_ENCRYPT_DISPLAY = "Encryption"
+STR_MODE_DECRYPT_DISPLAY = "Decryption"
+STR_DROP_FILE_ENCRYPT = "Drop Files or Folders for Encryption"
+STR_DROP_FILE_DECRYPT = "Drop ONE .age File for Decryption"
+STR_DROP_KEY_PUBLIC = "Recipient key needed! \n \n ( Drag and drop one or more public keys ) \n \n"
+STR_DROP_KEY_PRIVATE = "Identity key needed! \n \n ( Drag and drop one private key ) \n \n "
+
+# Messages that take arguments, rendered with f-strings.
+def _status_ready(key_count):
+    return f"Ready. Pub Keys: {key_count}."
+
+def _status_loaded_keys(key_count):
+    return f"Loaded {key_count} keys."
+
+def _status_loaded_and_start(key_count, mode_text):
+    return f"Loaded {key_count} keys. Executing ({mode_text})..."
+
+def _status_finished_keys(key_count):
+    return f"Finished. Keys: {key_count}."
+
+def _error_age_worker(error_msg):
+    return f"Age Worker Error: {error_msg}"
+
+def _error_files_fail(fail_count):
+    return f"Failed! {fail_count} files failed."
+
+def _drop_finished(mode_text):
+    return f"Finished {mode_text}"
+
+def _drop_error(message):
+    return f"Failed: {message}"
 
 # ==========================================
 #  AgeWorker
 # ==========================================
+# Whole comment lines in key files, matched over raw bytes in one pass.
+_COMMENT_LINE_RE = re.compile(rb'(?m)^[ \t\r\f\v]*#.*\n?')
+# Trailing " (n)" copy counter on a file stem.
+_SUFFIX_RE = re.compile(r' \((\d+)\)$')
+# How much of age's stderr is kept for the error dialog.
+_STDERR_TAIL_LINES = 20
+
 class AgeWorker(QThread):
     finished = Signal(int, int, bool)
     error = Signal(str, str) # file_name, error_message
-    progress_update = Signal(float)
+    progress_update = Signal(int)
 
     def __init__(self, mode, files_to_process, recipients_keys, parent=None):
         super().__init__(parent)
         self.mode = mode
         self.files_to_process = files_to_process
         self.recipients_keys = recipients_keys 
-        self._process = None
+        self._recipients_tmp = None
+        self._cmd_prefix = []
 
     def _find_unique_filename(self, path):
         """
@@ -149,7 +274,7 @@ class AgeWorker(QThread):
         filename = os.path.basename(path)
         
         name, ext = os.path.splitext(filename)
-        match = re.search(r' \((\d+)\)$', name)
+        match = _SUFFIX_RE.search(name)
         
         if match:
             base_name_without_suffix = name[:match.start()]
@@ -157,17 +282,112 @@ class AgeWorker(QThread):
         else:
             base_name_without_suffix = name
             start_num = 1
-        
+
+        # Read the directory once instead of stat-ing every candidate. Names are
+        # compared lowercased so case-insensitive filesystems never get a clash.
+        try:
+            taken = {entry.lower() for entry in os.listdir(directory or os.curdir)}
+        except OSError:
+            taken = None
+
         while True:
             new_name = f"{base_name_without_suffix} ({start_num}){ext}"
             new_path = os.path.join(directory, new_name)
             
-            if not os.path.exists(new_path):
+            if taken is None:
+                if not os.path.exists(new_path):
+                    return new_path
+            elif new_name.lower() not in taken:
                 return new_path
             
             start_num += 1
 
+    def _load_recipients(self):
+        """
+        Read every recipient key file once and return their contents (comments stripped) as one blob.
+        """
+        if not self.recipients_keys:
+            raise ValueError("No recipients.")
+
+        chunks = []
+        for key_path in self.recipients_keys:
+            try:
+                with open(key_path, 'rb') as key_f:
+                    content = _COMMENT_LINE_RE.sub(b'', key_f.read()).strip()
+            except FileNotFoundError:
+                continue
+            if content: chunks.append(content + b'\n')
+
+        if not chunks:
+            raise ValueError("Recipient key file is empty or invalid.")
+
+        return b"".join(chunks)
+
+    def _write_recipients_file(self, recipients_blob):
+        """
+        Write the recipients blob to a temp file for age's -R option.
+        Uses the system temp dir, so read-only input folders still work.
+        """
+        fd, temp_recipients_file = tempfile.mkstemp(prefix="age_r_", suffix=".txt")
+        with os.fdopen(fd, 'wb') as f:
+            f.write(recipients_blob)
+
+        return temp_recipients_file
+
+    def _process_one(self, input_path, popen):
+        """
+        Run age on a single file. Raises on failure.
+        popen is subprocess.Popen with the batch's spawn options already bound.
+        """
+        # --- Build command ---
+        if self.mode == "encrypt":
+            output_path = f"{input_path}.age" 
+
+        else: # decrypt
+            is_age_input = _is_age(input_path)
+            output_path_base = input_path[:-4] if is_age_input else f"{input_path}.decrypted"
+            
+            # === File conflict detected (automatically append numeric suffix) ===
+            # age writes straight to the free name; no temp file to rename.
+            output_path = self._find_unique_filename(output_path_base)
+
+        # Only the output and input differ between files in a batch.
+        cmd = self._cmd_prefix + ["-o", output_path, input_path]
+        
+        # --- Execute age command ---
+        process = popen(cmd)
+
+        if self.mode == "decrypt":
+            # The YubiKey prompt appears in age's console window.
+            bring_pid_to_front(process.pid)
+
+        # Only stderr is piped, so drain it to EOF and reap the process
+        # directly instead of going through communicate(). Just the last
+        # lines are kept; age reports the actual failure at the end.
+        with process.stderr:
+            stderr_tail = deque(process.stderr, maxlen=_STDERR_TAIL_LINES)
+        return_code = process.wait()
+
+        if return_code == 0:
+            if self.mode == "decrypt" and not os.path.exists(output_path):
+                raise IOError(f"Age returned success, but output file not found: {output_path}")
+            
+        else:
+            # Don't leave a partially written plaintext behind.
+            if self.mode == "decrypt" and os.path.exists(output_path):
+                try: 
+                    os.remove(output_path)
+                except: 
+                    pass
+
+            error_msg = b"".join(stderr_tail).decode('utf-8', errors='ignore').strip()
+            detail_msg = error_msg if error_msg else f"Failed, exit code: {return_code}"
+            raise Exception(detail_msg)
+
     def run(self):
+        # Only needed once a batch runs, so keep it off the startup path.
+        import subprocess
+
         success_count = 0
         processed_files = self.files_to_process[:]
         total_files = len(processed_files) 
@@ -175,138 +395,151 @@ class AgeWorker(QThread):
 
         try:
             creation_flags = 0
-            if os.name == 'nt':
-                creation_flags = subprocess.CREATE_NEW_CONSOLE
-
-            for i, input_path in enumerate(processed_files):
-                current_file_name = os.path.basename(input_path)
-                temp_recipients_file = None
-                temp_output_path = None
-                temp_decrypt_path = None
-                output_path_base = ""
-
-                try:
-                    cmd = ["age"]
-                    
-                    # --- Build command ---
-                    if self.mode == "encrypt":
-                        temp_output_path = f"{input_path}.age" 
-                            
-                        cmd.append("-a")
-                        cmd.extend(["-o", temp_output_path])
-
-                        if not self.recipients_keys:
-                            raise ValueError("No recipients.")
-
-                        temp_recipients_file = os.path.join(os.path.dirname(input_path) or os.getcwd(), f".temp_recipients_{os.getpid()}.txt")
-                        with open(temp_recipients_file, 'w') as f:
-                            for key_path in self.recipients_keys:
-                                if not os.path.exists(key_path): continue
-                                with open(key_path, 'r', encoding='utf-8') as key_f:
-                                    content = "".join([line for line in key_f if not line.strip().startswith('#')]).strip()
-                                    if content: f.write(content + '\n')
-                        
-                        if not os.path.exists(temp_recipients_file) or not os.path.getsize(temp_recipients_file):
-                            raise ValueError("Recipient key file is empty or invalid.")
-
-                        cmd.extend(["-R", temp_recipients_file])
-                        cmd.append(input_path)
-
-                    else: # decrypt
-                        cmd.append("-d")
-                        output_path_base = input_path.removesuffix(".age") if input_path.lower().endswith(".age") else f"{input_path}.decrypted"
-                        
-                        temp_decrypt_path = f"{output_path_base}.temp_decrypted_{os.getpid()}"
-                        
-                        cmd.extend(["-o", temp_decrypt_path])
-
-                        if not self.recipients_keys:
-                            raise ValueError("No identity.")
-
-                        for key_path in self.recipients_keys:
-                            cmd.extend(["-i", key_path])
-
-                        cmd.append(input_path)
-                    
-                    # --- Execute age command ---
-                    self._process = subprocess.Popen(
-                        cmd,
-                        stdout=subprocess.PIPE,
-                        stderr=subprocess.PIPE,
-                        creationflags=creation_flags
-                    )
-
-                    time.sleep(0.5)
-                    bring_pid_to_front(self._process.pid)
-
-                    stdout_output, stderr_output = self._process.communicate()
-                    return_code = self._process.returncode
-
-                    if return_code == 0:
-                        # === 2. Post-process (Rename/Cleanup) ===
-                        if self.mode == "encrypt":
-                            pass
-                            
-                        else: # decrypt mode
-                            
-                            # === File conflict detected (automatically append numeric suffix) ===
-                            if input_path.lower().endswith(".age"):
-                                
-                                if os.path.exists(temp_decrypt_path):
-                                    
-                                    expected_output_path = output_path_base 
-                                    final_output_path = self._find_unique_filename(expected_output_path)
-                                        
-                                    os.rename(temp_decrypt_path, final_output_path)
-
-                                else:
-                                    raise IOError(f"Age returned success, but output file not found: {temp_decrypt_path}")
-                            
+            if _IS_WIN:
+                # Decryption needs a console for the YubiKey prompt; encryption
+                # runs several age processes at once and stays hidden.
+                if self.mode == "decrypt":
+                    creation_flags = subprocess.CREATE_NEW_CONSOLE
+                else:
+                    creation_flags = subprocess.CREATE_NO_WINDOW
+
+            popen = partial(
+                subprocess.Popen,
+                stdout=subprocess.DEVNULL, # age writes to -o; stdout is never read
+                stderr=subprocess.PIPE,
+                # With an absolute path and close_fds off, CPython spawns via
+                # posix_spawn instead of fork+exec. Python's own fds are
+                # non-inheritable (PEP 446), so nothing extra leaks.
+                close_fds=_IS_WIN,
+                creationflags=creation_flags
+            )
+
+            # Resolve age once for the whole batch rather than per spawn.
+            age_path = shutil.which("age") or "age"
+
+            if self.mode == "encrypt":
+                # The recipients never change during a batch, so build their file once.
+                if processed_files:
+                    recipients_blob = self._load_recipients()
+                    self._recipients_tmp = self._write_recipients_file(recipients_blob)
+                self._cmd_prefix = [age_path, "-a", "-R", self._recipients_tmp]
+            else:
+                if not self.recipients_keys:
+                    raise ValueError("No identity.")
+                self._cmd_prefix = [age_path, "-d"]
+                for key_path in self.recipients_keys:
+                    self._cmd_prefix.extend(["-i", key_path])
+
+            # age is CPU-bound in its own process, so threads only wait on it.
+            max_workers = max(1, min(os.cpu_count() or 1, total_files))
+            last_emitted = 0
+            with ThreadPoolExecutor(max_workers=max_workers) as executor:
+                futures = {
+                    executor.submit(self._process_one, input_path, popen): input_path
+                    for input_path in processed_files
+                }
+
+                for done_count, future in enumerate(as_completed(futures), 1):
+                    try:
+                        future.result()
                         success_count += 1
-                        
-                    else:
-                        error_msg = stderr_output.decode('utf-8', errors='ignore').strip()
-                        detail_msg = error_msg if error_msg else f"Failed, exit code: {return_code}"
-                        raise Exception(detail_msg)
-
-                except Exception as e:
-                    self.error.emit(current_file_name, str(e))
-                finally:
-                    progress = (i + 1) / total_files
-                    self.progress_update.emit(progress)
-                    
-                    if temp_recipients_file and os.path.exists(temp_recipients_file):
-                        try: os.remove(temp_recipients_file)
-                        except: pass 
-                        
-                    if self.mode == "decrypt" and temp_decrypt_path and os.path.exists(temp_decrypt_path):
-                        try: 
-                            os.remove(temp_decrypt_path)
-                        except: 
-                            pass
+                    except Exception as e:
+                        self.error.emit(os.path.basename(futures[future]), str(e))
+                    finally:
+                        # Only signal when the whole percent moves; the bar
+                        # cannot show anything finer.
+                        percent = done_count * 100 // total_files
+                        if percent != last_emitted:
+                            self.progress_update.emit(percent)
+                            last_emitted = percent
 
 
         except Exception as e:
             self.error.emit("Pre-process", f"Pre-process Error: {e}")
             total_files = 0
         finally:
+            if self._recipients_tmp and os.path.exists(self._recipients_tmp):
+                try: os.remove(self._recipients_tmp)
+                except: pass
+            self._recipients_tmp = None
+
             self.finished.emit(success_count, total_files, needs_clear)
 
 
+# ==========================================
+#  FileScanWorker
+# ==========================================
+class FileScanWorker(QThread):
+    scanned = Signal(list)
+
+    def __init__(self, paths, parent=None):
+        super().__init__(parent)
+        self.paths = paths
+
+    def run(self):
+        """
+        Recursively traverse the dropped paths and collect all files.
+        """
+        file_list = []
+        for path in self.paths:
+            if os.path.basename(path).startswith('.'):
+                continue
+                
+            # One stat decides between file and folder.
+            try:
+                st_mode = os.stat(path).st_mode
+            except OSError:
+                continue
+
+            if stat.S_ISREG(st_mode):
+                file_list.append(path)
+            elif stat.S_ISDIR(st_mode):
+                # Same selection as os.walk, but straight off scandir entries:
+                # no per-directory tuples and no os.path.join per file.
+                pending = [path]
+                while pending:
+                    # Checked between directories so closing the window
+                    # does not have to wait for a whole tree.
+                    if self.isInterruptionRequested():
+                        return
+                    try:
+                        with os.scandir(pending.pop()) as entries:
+                            for entry in entries:
+                                if entry.is_dir():
+                                    # os.walk does not descend into symlinked directories either.
+                                    if not entry.is_symlink():
+                                        pending.append(entry.path)
+                                elif not entry.name.startswith('.'):
+                                    file_list.append(entry.path)
+                    except OSError:
+                        continue
+        self.scanned.emit(file_list)
+
+
 # ==========================================
 # 🖼️ Widget: Drop Target
 # ==========================================
+# mode -> (accent color key, background color key, message formatter).
+# Modes without an accent keep the default dashed frame; the rest get a
+# QFrame[dropMode="..."] rule in SingleDropTarget._apply_style.
+DROP_MODE_STYLES = {
+    "file": (None, None, None),
+    "key": (None, None, None),
+    "finished": ("SUCCESS_ACCENT", "SUCCESS_BG", _drop_finished),
+    "error": ("DANGER", "DANGER_BG", _drop_error),
+}
+
 class SingleDropTarget(QFrame):
     files_dropped = Signal(list)
     keys_dropped = Signal(list)
 
-    def __init__(self, main_window, colors, strings, parent=None):
+    def __init__(self, main_window, colors, parent=None):
         super().__init__(parent)
         self.main_window = main_window
         self.colors = colors
-        self.strings = strings 
         self.setAcceptDrops(True)
         self.mode = "file" 
+        self.setProperty("dropMode", self.mode)
 
         self._apply_style()
         self.setMinimumSize(320, 180)
@@ -314,19 +547,26 @@ class SingleDropTarget(QFrame):
         self.layout = QVBoxLayout(self)
         self.layout.setAlignment(Qt.AlignCenter)
      
-        self.label = QLabel(self.strings["STR_DROP_FILE_ENCRYPT"], objectName="DropText", alignment=Qt.AlignCenter)
+        self.label = QLabel(STR_DROP_FILE_ENCRYPT, objectName="DropText", alignment=Qt.AlignCenter)
         self.label.setFont(QFont("Arial", 12))
         self.layout.addWidget(self.label)
-
-        shadow = QGraphicsDropShadowEffect()
-        shadow.setBlurRadius(20)
-        shadow_color = QColor(0, 0, 0, 50) if self.colors == LIGHT_THEME_COLORS else QColor(0, 0, 0, 80)
-        shadow.setColor(shadow_color)
-        shadow.setOffset(QPoint(0, 5))
-        self.setGraphicsEffect(shadow)
     
-    def _apply_style(self, style_override=""):
-         self.setStyleSheet(f"""
+    def _apply_style(self):
+        """
+        Install one sheet covering every mode; set_mode only flips the dropMode property.
+        """
+        mode_rules = []
+        for mode, (accent_key, bg_key, _) in DROP_MODE_STYLES.items():
+            if not accent_key:
+                continue
+            accent = self.colors[accent_key]
+            mode_rules.append(f"""
+            QFrame[dropMode="{mode}"] {{
+                border: 2px solid {accent}; background-color: {self.colors[bg_key]};
+            }}
+            QFrame[dropMode="{mode}"] QLabel#DropText {{ color: {accent}; }}""")
+
+        self.setStyleSheet(f"""
             QFrame {{
                 border: 2px dashed {self.colors["BORDER"]};
                 border-radius: 10px;
@@ -337,7 +577,7 @@ class SingleDropTarget(QFrame):
                 border: none; background-color: transparent; color: {self.colors["TEXT_SECONDARY"]};
                 font-weight: 500;
             }}
-            {style_override}
+            {"".join(mode_rules)}
         """)
 
     def dragEnterEvent(self, event):
@@ -348,43 +588,42 @@ class SingleDropTarget(QFrame):
 
     def set_mode(self, mode, message=None):
         """Sets the drop target mode and updates the message."""
+        previous_mode = self.mode
         self.mode = mode
         
-        style_override = ""
-        new_text = ""
-        text_color = self.colors["TEXT_SECONDARY"]
+        format_message = DROP_MODE_STYLES[mode][2]
 
         if mode == "file":
-          
             if self.main_window.current_action_mode == "decrypt":
-                new_text = self.strings["STR_DROP_FILE_DECRYPT"]
+                new_text = STR_DROP_FILE_DECRYPT
             else:
-                new_text = self.strings["STR_DROP_FILE_ENCRYPT"]
+                new_text = STR_DROP_FILE_ENCRYPT
         elif mode == "key":
-            new_text = message if message else self.strings["STR_DROP_KEY_PUBLIC"] 
-        elif mode == "finished":
-            accent = self.colors["SUCCESS_ACCENT"]
-            bg = self.colors["SUCCESS_BG"]
-            new_text = self.strings["STR_DROP_FINISHED"] % message
-            style_override = f"border: 2px solid {accent}; background-color: {bg};"
-            text_color = accent
-        elif mode == "error":
-            accent = self.colors["DANGER"]
-            bg = self.colors["DANGER_BG"]
-            new_text = self.strings["STR_DROP_ERROR"] % message
-            style_override = f"border: 2px solid {accent}; background-color: {bg};"
-            text_color = accent
-        
-        self._apply_style(style_override)
+            new_text = message if message else STR_DROP_KEY_PUBLIC 
+        else:
+            new_text = format_message(message)
+
+        # Re-resolve the [dropMode] selectors; the sheet itself is not re-parsed.
+        # Modes that share a look (e.g. "file" and "key") skip the re-polish.
+        self.setProperty("dropMode", mode)
+        if DROP_MODE_STYLES[previous_mode][:2] != DROP_MODE_STYLES[mode][:2]:
+            for widget in (self, self.label):
+                widget.style().unpolish(widget)
+                widget.style().polish(widget)
         self.label.setText(new_text)
-        self.label.setStyleSheet(f"color: {text_color}; font-weight: 500;")
 
 
     def dropEvent(self, event: QDropEvent):
         mime = event.mimeData()
         if mime.hasUrls():
         
-            paths = [u.toLocalFile() for u in mime.urls() if u.isLocalFile() and os.path.exists(u.toLocalFile())]
+            paths = []
+            for url in mime.urls():
+                if not url.isLocalFile():
+                    continue
+                path = url.toLocalFile()
+                if os.path.exists(path):
+                    paths.append(path)
 
             if not paths:
                 event.ignore()
@@ -408,94 +647,46 @@ class SingleDropTarget(QFrame):
 # ==========================================
 class AgeGUI(QMainWindow):
     SETTINGS_FILE = "settings.ini"
-
-    STRINGS = {
-        "STR_TITLE": "YubiAge UI v0.1.1",
-        "STR_MSGBOX_TITLE": "Message",
-        "STR_STATUS_READY": "Ready. Pub Keys: %s.",
-        "STR_STATUS_LOADED_KEYS": "Loaded %d keys.",
-        "STR_STATUS_ENCRYPT_MODE": "Encrypt Mode",
-        "STR_STATUS_DECRYPT_MODE": "Decrypt Mode",
-        "STR_STATUS_START_PROCESS": "Executing (%s)...",
-        "STR_STATUS_FINISHED_KEYS": "Finished. Keys: %d.",
-        "STR_STATUS_ERROR_MIXED": "Terminated.",
-        "STR_STATUS_ERROR_KEY_LOAD": "Key load failed.",
-        "STR_STATUS_ERROR_FILE_KEY_MISSING": "File/Key missing.",
-        "STR_BTN_CLEAR": "Clear State",
-        "STR_BTN_CLEAR_KEYS": "Clear Keys", 
-        "STR_CONFIRM_CLEAR_KEYS": "Are you sure you want to clear ALL saved public recipient key paths? They must be dropped again for future encryption.",
-        "STR_ERROR_MIXED_FILES": "Do not mix .age file and non-.age file.",
-        "STR_ERROR_INVALID_KEY_PATH": "Invalid key path.",
-        "STR_ERROR_AGE_WORKER": "Age Worker Error: %s",
-        "STR_ERROR_FILES_FAIL": "Failed! %d files failed.",
-        "STR_ERROR_DECRYPT_MULTI": "One file at a time (no folders)", 
-        "STR_MODE_ENCRYPT_DISPLAY": "Encryption",
-        "STR_MODE_DECRYPT_DISPLAY": "Decryption",
-        "STR_DROP_FILE_ENCRYPT": "Drop Files or Folders for Encryption", 
-        "STR_DROP_FILE_DECRYPT": "Drop ONE .age File for Decryption", 
-        "STR_DROP_KEY_PUBLIC": "Recipient key needed! \n \n ( Drag and drop one or more public keys ) \n \n",
-        "STR_DROP_KEY_PRIVATE": "Identity key needed! \n \n ( Drag and drop one private key ) \n \n ",
-        "STR_DROP_FINISHED": "Finished %s",
-        "STR_DROP_ERROR": "Failed: %s",
-    }
+    SETTINGS_FLUSH_DELAY_MS = 500
 
     def __init__(self):
         super().__init__()
 
         # 1. Theme initialization
-        self.is_dark_mode = darkdetect.isDark()
+        self.is_dark_mode = _system_is_dark()
         self.colors = DARK_THEME_COLORS if self.is_dark_mode else LIGHT_THEME_COLORS
-        self.strings = self.STRINGS
 
-        self.setWindowTitle(self.strings["STR_TITLE"])
+        self.setWindowTitle(STR_TITLE)
         
         self.setFixedSize(450, 320)
 
         # State variables
-        self.keys = []                  
-        self.recipients_keys = []       
+        self.keys = ()
+        self.recipients_keys = ()
         self.files_to_process = []
         self.current_action_mode = None 
         self._key_pending = False
         self.worker = None
-
-        # 2. Apply initial theme
-        self.setStyleSheet(get_base_stylesheet(self.colors))
-        self._set_qmessagebox_style()
+        self.scan_worker = None
+        self._confirm_clear_box = None
+        self._pending_remember = None
+        self._pending_keys = ()
+        self._settings_path = self._get_settings_path()
+        self._settings = QSettings(self._settings_path, QSettings.IniFormat)
+        # Coalesces key-setting changes that land close together into one write.
+        self._settings_flush_timer = QTimer(self, singleShot=True, interval=self.SETTINGS_FLUSH_DELAY_MS)
+        self._settings_flush_timer.timeout.connect(self._flush_key_settings)
+        # A quit that bypasses closeEvent (QApplication.quit, logout) still gets the queued write.
+        QApplication.instance().aboutToQuit.connect(self._flush_pending_key_settings)
+
+        # 2. Apply initial theme (palette for plain colors, one app-wide sheet for the rest)
+        app = QApplication.instance()
+        app.setPalette(get_palette(self.colors))
+        app.setStyleSheet(DARK_QSS if self.is_dark_mode else LIGHT_QSS)
 
         self._init_ui()
         self._load_key_settings()
 
-    def _set_qmessagebox_style(self):
-      
-        text_color = self.colors["TEXT_PRIMARY"]
-        bg_color = self.colors["CARD_BG"]
-        btn_bg = self.colors["CARD_BG"]
-        btn_text = self.colors["TEXT_PRIMARY"]
-        
-        style = f"""
-            QMessageBox {{
-                background-color: {bg_color};
-            }}
-            QMessageBox QLabel {{
-                color: {text_color};
-            }}
-            QMessageBox QPushButton {{
-                border-radius: 6px; font-weight: 500; padding: 6px 12px;
-                background-color: {btn_bg};
-                color: {btn_text};
-                border: 1px solid {self.colors['BORDER']};
-            }}
-            QMessageBox QPushButton:hover {{
-                background-color: {self.colors['BORDER']};
-            }}
-        """
-
-        app = QApplication.instance()
-        current_style = app.styleSheet()
-        new_style = current_style.split("QMessageBox {")[0] + style
-        app.setStyleSheet(new_style)
-
     def _get_settings_path(self):
         if getattr(sys, 'frozen', False):
             return os.path.join(os.path.dirname(sys.executable), self.SETTINGS_FILE)
@@ -512,7 +703,6 @@ class AgeGUI(QMainWindow):
         self.drop_target = SingleDropTarget(
             main_window=self, 
             colors=self.colors, 
-            strings=self.STRINGS, 
             parent=central
         )
         self.drop_target.files_dropped.connect(self._on_files_dropped)
@@ -524,18 +714,18 @@ class AgeGUI(QMainWindow):
 
         footer_layout = QHBoxLayout()
         
-        self.btn_clear_keys = QPushButton(self.strings["STR_BTN_CLEAR_KEYS"], objectName="ClearKeysBtn")
+        self.btn_clear_keys = QPushButton(STR_BTN_CLEAR_KEYS, objectName="ClearKeysBtn")
         self.btn_clear_keys.clicked.connect(self._clear_keys_action)
         self.btn_clear_keys.setFixedSize(100, 28)
         footer_layout.addWidget(self.btn_clear_keys) 
 
-        self.status_label = QLabel(self.strings["STR_STATUS_READY"] % "0", alignment=Qt.AlignVCenter)
+        self.status_label = QLabel(_status_ready(0), alignment=Qt.AlignVCenter)
         self.status_label.setFont(QFont("Arial", 10))
         self.status_label.setStyleSheet(f"color: {self.colors['TEXT_SECONDARY']};")
         footer_layout.addWidget(self.status_label, 1) 
         
-        self.btn_clear = QPushButton(self.strings["STR_BTN_CLEAR"], objectName="ClearBtn")
-        self.btn_clear.clicked.connect(lambda: self._reset_state_ui(clear_keys=False))
+        self.btn_clear = QPushButton(STR_BTN_CLEAR, objectName="ClearBtn")
+        self.btn_clear.clicked.connect(self._on_clear_clicked)
         self.btn_clear.setFixedSize(90, 28)
         footer_layout.addWidget(self.btn_clear)
 
@@ -546,7 +736,7 @@ class AgeGUI(QMainWindow):
         self.files_to_process = []
         self._key_pending = False
         self.current_action_mode = None
-        self.keys = [] 
+        self.keys = ()
         self.progress.setValue(0)
         self.drop_target.setDisabled(False)
         self.btn_clear.setDisabled(False)
@@ -556,75 +746,99 @@ class AgeGUI(QMainWindow):
         self.drop_target.set_mode("file") 
 
         if clear_keys:
-            self.recipients_keys = [] 
+            self.recipients_keys = ()
 
-        key_status = str(len(self.recipients_keys))
-        self.status_label.setText(self.strings["STR_STATUS_READY"] % key_status)
+        self.status_label.setText(_status_ready(len(self.recipients_keys)))
+
+    def _on_clear_clicked(self):
+        self._reset_state_ui(clear_keys=False)
 
     def _clear_keys_action(self):
         if not self.recipients_keys:
-            self.status_label.setText(self.strings["STR_STATUS_READY"] % "0")
+            self.status_label.setText(_status_ready(0))
             return
 
-        reply = QMessageBox.question(
-            self, 
-            self.strings["STR_BTN_CLEAR_KEYS"], 
-            self.strings["STR_CONFIRM_CLEAR_KEYS"], 
-            QMessageBox.Yes | QMessageBox.No, 
-            QMessageBox.No 
-        )
+        # The confirmation never changes, so build the dialog on first use only.
+        if self._confirm_clear_box is None:
+            self._confirm_clear_box = QMessageBox(
+                QMessageBox.Question,
+                STR_BTN_CLEAR_KEYS,
+                STR_CONFIRM_CLEAR_KEYS,
+                QMessageBox.Yes | QMessageBox.No,
+                self
+            )
+            self._confirm_clear_box.setDefaultButton(QMessageBox.No)
+
+        reply = self._confirm_clear_box.exec()
 
         if reply == QMessageBox.Yes:
-            self.recipients_keys = []
-            self._save_key_settings([], False) 
+            self.recipients_keys = ()
+            self._save_key_settings((), False) 
 
-            self.keys = []
+            self.keys = ()
 
             if self._key_pending:
                 self._reset_state_ui(clear_keys=False) 
 
-            self.status_label.setText(self.strings["STR_STATUS_READY"] % "0")
+            self.status_label.setText(_status_ready(0))
 
     def _load_key_settings(self):
-        settings = QSettings(self._get_settings_path(), QSettings.IniFormat)
-        is_remembered = settings.value("Keys/RememberKeys", "false") == "true"
+        is_remembered = self._settings.value("Keys/RememberKeys", "false") == "true"
+        stored_paths = self._settings.value("Keys/Paths", [], type=list)
+
+        # Settings from v0.1.1 and earlier hold a single ';'-joined string.
+        if len(stored_paths) == 1 and ";" in stored_paths[0] and not _is_file(stored_paths[0]):
+            stored_paths = stored_paths[0].split(";")
+
+        # Latest key settings, written or still queued for _flush_key_settings (unfiltered),
+        # so _save_key_settings can skip no-op writes.
+        self._pending_remember = is_remembered
+        self._pending_keys = tuple(p for p in stored_paths if p)
 
         if is_remembered:
-            key_paths_str = settings.value("Keys/Paths", "")
-            key_paths = [p for p in key_paths_str.split(';') if os.path.exists(p) and p]
+            key_paths = tuple(dict.fromkeys(p for p in self._pending_keys if _is_file(p)))
 
             if key_paths:
                 self.recipients_keys = key_paths 
-                self.status_label.setText(self.strings["STR_STATUS_LOADED_KEYS"] % len(self.recipients_keys))
-
-    def _save_key_settings(self, keys_to_save: list, remember: bool):
-        settings = QSettings(self._get_settings_path(), QSettings.IniFormat)
-        settings.setValue("Keys/RememberKeys", "true" if remember else "false")
+                self.status_label.setText(_status_loaded_keys(len(self.recipients_keys)))
 
-        if remember:
-            settings.setValue("Keys/Paths", ";".join(keys_to_save))
-        else:
-            settings.setValue("Keys/Paths", "")
+    def _save_key_settings(self, keys_to_save: tuple, remember: bool):
+        keys_tuple = tuple(keys_to_save) if remember else ()
+        if remember == self._pending_remember and keys_tuple == self._pending_keys:
+            return
 
-        settings.sync()
+        # Record the new state now; the write itself is deferred and debounced.
+        self._pending_remember = remember
+        self._pending_keys = keys_tuple
+        self._settings_flush_timer.start()
+
+    def _flush_key_settings(self):
+        self._settings_flush_timer.stop()
+        self._settings.setValue("Keys/RememberKeys", "true" if self._pending_remember else "false")
+
+        # Stored as a native string list, so paths containing ';' survive.
+        self._settings.setValue("Keys/Paths", list(self._pending_keys))
+        self._settings.sync()
+
+    def _flush_pending_key_settings(self):
+        if self._settings_flush_timer.isActive():
+            self._flush_key_settings()
+
+    def closeEvent(self, event):
+        self._flush_pending_key_settings()
+        if self.scan_worker is not None and self.scan_worker.isRunning():
+            # Destroying a running QThread aborts the process, and a late
+            # result must not reach a window that is going away.
+            self.scan_worker.scanned.disconnect(self._on_scan_complete)
+            self.scan_worker.requestInterruption()
+            self.scan_worker.wait()
+            self.scan_worker = None
+        super().closeEvent(event)
         
-    def _get_files_recursive(self, paths):
-        """
-        Recursively traverse the path and collect all files.
-        """
-        file_list = []
-        for path in paths:
-            if os.path.basename(path).startswith('.'):
-                continue
-                
-            if os.path.isfile(path):
-                file_list.append(path)
-            elif os.path.isdir(path):
-                for root, _, files in os.walk(path):
-                    for file_name in files:
-                        if not file_name.startswith('.'):
-                            file_list.append(os.path.join(root, file_name))
-        return file_list
+    def _show_error(self, message, status=STR_STATUS_ERROR_MIXED):
+        """Put the drop target into its error state and show status in the footer."""
+        self.drop_target.set_mode("error", message)
+        self.status_label.setText(status)
 
     def _on_files_dropped(self, paths):
         """
@@ -634,21 +848,28 @@ class AgeGUI(QMainWindow):
         if self._key_pending: return
 
         # 1. Preliminary pattern assessment (prioritize determining if it's for decryption)
-        has_age_files = any(p.lower().endswith(".age") for p in paths)
-        is_decrypt_mode = has_age_files or all(os.path.isfile(p) and p.lower().endswith(".age") for p in paths)
+        # Any .age path means decryption (the "all .age" case is a subset of this),
+        # so each path's suffix is checked exactly once and nothing is stat'ed yet.
+        is_decrypt_mode = any(_is_age(p) for p in paths)
         
         # 2. **Decryption Mode Restriction Check (YubiKey Security Restriction)**
         if is_decrypt_mode:
+            # paths[0] is the .age path when it is alone; one stat answers both checks below.
+            st_mode = 0
+            if len(paths) == 1:
+                try:
+                    st_mode = os.stat(paths[0]).st_mode
+                except OSError:
+                    pass
+
             # Only a single file can be dragged in; folders and multiple files are not allowed.
-            if len(paths) > 1 or os.path.isdir(paths[0]):
-                self.drop_target.set_mode("error", self.strings["STR_ERROR_DECRYPT_MULTI"])
-                self.status_label.setText(self.strings["STR_STATUS_ERROR_MIXED"])
+            if len(paths) > 1 or stat.S_ISDIR(st_mode):
+                self._show_error(STR_ERROR_DECRYPT_MULTI)
                 return
             
             # Make sure the single file you drag in is a .age file.
-            if not paths[0].lower().endswith(".age") or not os.path.isfile(paths[0]):
-                self.drop_target.set_mode("error", "The file must be a single .age file.")
-                self.status_label.setText(self.strings["STR_STATUS_ERROR_MIXED"])
+            if not stat.S_ISREG(st_mode):
+                self._show_error("The file must be a single .age file.")
                 return
 
             self.files_to_process = paths
@@ -656,23 +877,43 @@ class AgeGUI(QMainWindow):
             
         else:
             # 3. Encryption mode (batch processing allowed)
-            collected_files = self._get_files_recursive(paths)
-            
-            if not collected_files:
-                self.drop_target.set_mode("error", "No valid files found for encryption.")
-                self.status_label.setText(self.strings["STR_STATUS_ERROR_MIXED"])
-                return
-            
-            # Check for the presence of .age files
-            if any(p.lower().endswith(".age") for p in collected_files):
-                self.drop_target.set_mode("error", self.strings["STR_ERROR_MIXED_FILES"])
-                self.status_label.setText(self.strings["STR_STATUS_ERROR_MIXED"])
-                return
+            # Large folders take a while to walk, so scan them off the GUI
+            # thread and pick up again in _on_scan_complete.
+            self.drop_target.setDisabled(True)
+            self.btn_clear.setDisabled(True)
+            self.btn_clear_keys.setDisabled(True)
+            self.progress.setRange(0, 0)
+
+            self.scan_worker = FileScanWorker(paths, self)
+            self.scan_worker.scanned.connect(self._on_scan_complete)
+            self.scan_worker.finished.connect(self.scan_worker.deleteLater)
+            self.scan_worker.start()
+            return
+
+        self._proceed_with_files()
+
+    def _on_scan_complete(self, collected_files):
+        # The thread deletes itself once finished; drop the reference now.
+        self.scan_worker = None
+        self.progress.setRange(0, 100)
+        self.drop_target.setDisabled(False)
+        self.btn_clear.setDisabled(False)
+        self.btn_clear_keys.setDisabled(False)
 
-            self.files_to_process = collected_files
-            self.current_action_mode = "encrypt"
+        if not collected_files:
+            self._show_error("No valid files found for encryption.")
+            return
+        
+        # Check for the presence of .age files
+        if any(_is_age(p) for p in collected_files):
+            self._show_error(STR_ERROR_MIXED_FILES)
+            return
 
+        self.files_to_process = collected_files
+        self.current_action_mode = "encrypt"
+        self._proceed_with_files()
 
+    def _proceed_with_files(self):
         # 4. Proceed to the next step according to the pattern.
         total_files = len(self.files_to_process)
         
@@ -680,29 +921,28 @@ class AgeGUI(QMainWindow):
             # Decrypt Mode: File check complete, next step requires key.
             self._key_pending = True
             # Users will need to pay attention to the CLI interface (where YubiKey prompts will appear).
-            self.drop_target.set_mode("key", f"{self.strings['STR_DROP_KEY_PRIVATE']} After drop: Check console window")
-            self.status_label.setText(self.strings["STR_STATUS_DECRYPT_MODE"])
+            self.drop_target.set_mode("key", f"{STR_DROP_KEY_PRIVATE} After drop: Check console window")
+            self.status_label.setText(STR_STATUS_DECRYPT_MODE)
         else:
             # Encrypt Mode
             if not self.recipients_keys: 
                 # Require public key
                 self._key_pending = True
-                self.drop_target.set_mode("key", f"{self.strings['STR_DROP_KEY_PUBLIC']} ({total_files} files)")
-                self.status_label.setText(self.strings["STR_STATUS_ENCRYPT_MODE"])
+                self.drop_target.set_mode("key", f"{STR_DROP_KEY_PUBLIC} ({total_files} files)")
+                self.status_label.setText(STR_STATUS_ENCRYPT_MODE)
             else:
                 # Start directly using the stored public key.
-                self.keys = list(self.recipients_keys)
-                self.status_label.setText(f"{self.strings['STR_STATUS_LOADED_KEYS'] % len(self.keys)} {self.strings['STR_STATUS_START_PROCESS'] % 'encrypt'} ({total_files} files)")
+                self.keys = self.recipients_keys
                 self._start_process()
 
     def _on_keys_dropped_in_key_mode(self, paths):
         if not self._key_pending: return
 
-        valid_key_paths = [p for p in paths if os.path.exists(p) and os.path.isfile(p)] 
+        # Dropping the same key twice (or re-dropping it) must not list it twice.
+        valid_key_paths = tuple(dict.fromkeys(p for p in paths if _is_file(p)))
 
         if not valid_key_paths:
-            self.drop_target.set_mode("error", self.strings["STR_ERROR_INVALID_KEY_PATH"])
-            self.status_label.setText(self.strings["STR_STATUS_ERROR_KEY_LOAD"])
+            self._show_error(STR_ERROR_INVALID_KEY_PATH, STR_STATUS_ERROR_KEY_LOAD)
             self.drop_target.setDisabled(False)
             return
 
@@ -712,16 +952,12 @@ class AgeGUI(QMainWindow):
         if self.current_action_mode == "encrypt":
             self.recipients_keys = valid_key_paths 
             self._save_key_settings(self.recipients_keys, True)
-            total_files = len(self.files_to_process)
-            self.status_label.setText(f"{self.strings['STR_STATUS_LOADED_KEYS'] % len(self.recipients_keys)} {self.strings['STR_STATUS_START_PROCESS'] % 'encrypt'} ({total_files} files)")
-        elif self.current_action_mode == "decrypt":
-            self.status_label.setText(f"{self.strings['STR_STATUS_LOADED_KEYS'] % len(self.keys)} {self.strings['STR_STATUS_START_PROCESS'] % 'decrypt'} (1 file)")
 
         self._start_process()
 
     def _start_process(self):
         if not self.files_to_process or not self.keys:
-            self.drop_target.set_mode("error", self.strings["STR_STATUS_ERROR_FILE_KEY_MISSING"])
+            self.drop_target.set_mode("error", STR_STATUS_ERROR_FILE_KEY_MISSING)
             self._reset_state_ui(clear_keys=False) 
             return
 
@@ -730,23 +966,25 @@ class AgeGUI(QMainWindow):
         self.btn_clear_keys.setDisabled(True)
 
         mode_text = 'encrypt' if self.current_action_mode == 'encrypt' else 'decrypt'
-        self.status_label.setText(self.strings["STR_STATUS_START_PROCESS"] % mode_text)
+        self.status_label.setText(_status_loaded_and_start(len(self.keys), mode_text))
         self.progress.setRange(0, 0) # Indeterminate progress bar
 
         self.worker = AgeWorker(self.current_action_mode, self.files_to_process, self.keys)
         self.worker.finished.connect(self._on_finished)
 
         def report_error(file_name, error_msg):
-            formatted_error = self.strings["STR_ERROR_AGE_WORKER"] % error_msg
-            QMessageBox.critical(self, self.strings["STR_MSGBOX_TITLE"], f"File: {file_name}\n\n{formatted_error}")
+            formatted_error = _error_age_worker(error_msg)
+            QMessageBox.critical(self, STR_MSGBOX_TITLE, f"File: {file_name}\n\n{formatted_error}")
             
         self.worker.error.connect(report_error)
         self.worker.progress_update.connect(self._update_progress)
         self.worker.start()
 
     def _update_progress(self, val):
-        self.progress.setRange(0, 100)
-        self.progress.setValue(int(val * 100))
+        # Leave the indeterminate (0, 0) range only once, on the first tick.
+        if self.progress.maximum() == 0:
+            self.progress.setRange(0, 100)
+        self.progress.setValue(val)
 
     def _on_finished(self, success, total, needs_clear):
         self.progress.setValue(100)
@@ -755,34 +993,32 @@ class AgeGUI(QMainWindow):
         self.btn_clear_keys.setDisabled(False)
 
         if total == 0:
-            self.drop_target.set_mode("error", self.strings["STR_STATUS_ERROR_MIXED"])
-            self.status_label.setText(self.strings["STR_STATUS_ERROR_MIXED"])
+            self._show_error(STR_STATUS_ERROR_MIXED)
             self._reset_state_ui(clear_keys=False) 
             
         elif success == total:
             if self.current_action_mode == 'encrypt':
-                mode_text_display = self.strings["STR_MODE_ENCRYPT_DISPLAY"]
+                mode_text_display = STR_MODE_ENCRYPT_DISPLAY
                 key_count = len(self.recipients_keys) 
             else:
-                mode_text_display = self.strings["STR_MODE_DECRYPT_DISPLAY"]
+                mode_text_display = STR_MODE_DECRYPT_DISPLAY
                 key_count = 0 
 
             self.drop_target.set_mode("finished", mode_text_display)
-            self.status_label.setText(self.strings["STR_STATUS_FINISHED_KEYS"] % key_count)
+            self.status_label.setText(_status_finished_keys(key_count))
             
             if self.current_action_mode == "decrypt":
                 self.files_to_process = []
-                self.keys = []
+                self.keys = ()
             
         else:
             error_count = total - success
-            self.drop_target.set_mode("error", self.strings["STR_ERROR_FILES_FAIL"] % error_count)
-            self.status_label.setText(self.strings["STR_STATUS_ERROR_MIXED"])
+            self._show_error(_error_files_fail(error_count))
             self._reset_state_ui(clear_keys=False) 
 
 
 if __name__ == "__main__":
-    if os.name == 'nt':
+    if _IS_WIN:
         os.environ["AGE_DISABLE_PTE"] = "1" 
 
     try: